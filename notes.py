@@ -1,30 +1,54 @@
 import os
 import asyncio
+import time
 import re # Added regex import, although not strictly needed for this simple parsing
 from textual.app import App, ComposeResult
 from textual.widgets import TextArea, Footer, Header, Input, Label
 from textual.screen import ModalScreen
 from textual.containers import Grid
 from textual.binding import Binding
-import google.generativeai as genai
-import simplenote
 
 # --- Configuration ---
+# google.generativeai and simplenote pull in large dependency trees, so they
+# are imported on first use rather than at startup.
+
 # Initialize Google AI
 # Ensure your GOOGLE_API_KEY environment variable is set
-try:
-    genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
-except Exception:
-    print("Warning: GOOGLE_API_KEY environment variable not found. AI features disabled.")
+_genai = None
+
+
+def _ensure_ai_configured():
+    """Import and configure Google AI once; returns the genai module."""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        genai.configure(api_key=os.environ.get("GOOGLE_API_KEY"))
+        _genai = genai
+    return _genai
+
 
 # Initialize Simplenote
 # Ensure SIMPLENOTE_USER and SIMPLENOTE_PASSWORD environment variables are set
 sn_user = os.environ.get("SIMPLENOTE_USER")
 sn_pass = os.environ.get("SIMPLENOTE_PASSWORD")
-try:
-    sn_client = simplenote.Simplenote(sn_user, sn_pass)
-except Exception:
-    print("Warning: Simplenote credentials not found. Saving features may fail.")
+_sn_client = None
+
+
+def _get_simplenote_client():
+    """Import simplenote and build the client once."""
+    global _sn_client
+    if _sn_client is None:
+        import simplenote
+        _sn_client = simplenote.Simplenote(sn_user, sn_pass)
+    return _sn_client
+
+# Cached AI replies are reused for a day before asking Gemini again
+_AI_CACHE_TTL = 24 * 60 * 60
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Cache key for a prompt: case- and whitespace-insensitive."""
+    return " ".join(prompt.casefold().split())
 
 
 class AskAIModal(ModalScreen[str]):
@@ -78,23 +102,36 @@ class NoteApp(App):
         Binding("ctrl+n", "new_note", "New Note"),
         Binding("ctrl+s", "save_note", "Save Note"),
         Binding("ctrl+g", "ask_ai", "Ask AI"),
+        Binding("ctrl+t", "toggle_ai_cache", "Toggle AI Cache"),
         Binding("ctrl+q", "quit", "Quit"),
     ]
 
+    def __init__(self):
+        super().__init__()
+        # Normalized prompt -> (monotonic timestamp, reply text)
+        self._ai_cache: dict[str, tuple[float, str]] = {}
+        self.ai_cache_enabled = True
+        # Gemini model handle, created on first query and reused afterwards
+        self._model = None
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield TextArea(id="editor")
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache the editor so saves and AI replies don't query the DOM."""
+        self._editor = self.query_one(TextArea)
+
     def action_new_note(self) -> None:
         """Clears text area immediately."""
-        editor = self.query_one(TextArea)
+        editor = self._editor
         editor.text = ""
         self.notify("Editor cleared for new note.")
 
     def action_save_note(self) -> None:
         """Trigger manual save."""
-        editor = self.query_one(TextArea)
+        editor = self._editor
         content = editor.text.strip()
         
         if not content:
@@ -106,18 +143,19 @@ class NoteApp(App):
     def save_to_simplenote(self, content: str) -> None:
         """Parses content and sends to Simplenote, skipping the first three lines."""
         
-        lines = content.splitlines()
-        
-        if not lines:
+        if not content:
             return
 
+        # Only the first three line breaks matter; leave the body unsplit
+        parts = content.split("\n", 3)
+
         # 1. Extract Title (First Line)
-        title = lines[0].strip()
+        title = parts[0].strip()
 
         # 2. Extract Tags (Second Line, if in parens)
         tags = []
-        if len(lines) > 1:
-            second_line = lines[1].strip()
+        if len(parts) > 1:
+            second_line = parts[1].strip()
             if second_line.startswith("(") and second_line.endswith(")"):
                 # Remove parens and split by comma
                 tag_str = second_line[1:-1]
@@ -125,8 +163,8 @@ class NoteApp(App):
 
         # 3. Construct Note Body (Fourth line onwards)
         # Note: We skip lines 0 (title), 1 (tags), and 2 (assumed empty line)
-        if len(lines) >= 4:
-            note_body = "\n".join(lines[3:])
+        if len(parts) >= 4:
+            note_body = parts[3]
         else:
             note_body = "" # If note is too short, the body is empty
 
@@ -150,8 +188,12 @@ class NoteApp(App):
     async def _async_save(self, note_data, title_log):
         """Worker function for saving."""
         try:
-            # Simplenote client is synchronous, so use asyncio.to_thread
-            result, status = await asyncio.to_thread(sn_client.add_note, note_data)
+            # Simplenote client is synchronous, so run it in the default executor
+            # (no context to propagate, so skip asyncio.to_thread's copy_context)
+            loop = asyncio.get_running_loop()
+            # First use imports simplenote; keep that off the UI thread too
+            sn_client = await loop.run_in_executor(None, _get_simplenote_client)
+            result, status = await loop.run_in_executor(None, sn_client.add_note, note_data)
             if status == 0:
                 self.notify(f"Saved: '{title_log}'")
             else:
@@ -163,6 +205,12 @@ class NoteApp(App):
         """Opens the modal to ask AI."""
         self.push_screen(AskAIModal(), self.handle_ai_response)
 
+    def action_toggle_ai_cache(self) -> None:
+        """Turn reuse of cached AI replies on or off."""
+        self.ai_cache_enabled = not self.ai_cache_enabled
+        state = "enabled" if self.ai_cache_enabled else "disabled"
+        self.notify(f"AI response cache {state}.")
+
     def handle_ai_response(self, prompt: str) -> None:
         """Callback when modal is submitted."""
         if not prompt:
@@ -174,16 +222,43 @@ class NoteApp(App):
     async def _async_ai_query(self, prompt: str):
         """Worker function for AI generation."""
         try:
-            model = genai.GenerativeModel('gemini-2.5-flash')
-            response = await asyncio.to_thread(model.generate_content, prompt)
+            key = _normalize_prompt(prompt)
+            cached = None
+            if self.ai_cache_enabled:
+                cached = self._ai_cache.get(key)
+                if cached is not None and time.monotonic() - cached[0] >= _AI_CACHE_TTL:
+                    # Stale: evict it and ask again
+                    del self._ai_cache[key]
+                    cached = None
+
+            if cached is not None:
+                reply_text = cached[1]
+                notice = "AI response added (cached)."
+            else:
+                loop = asyncio.get_running_loop()
+                if self._model is None:
+                    # First use imports google.generativeai; keep that off the UI thread
+                    genai = await loop.run_in_executor(None, _ensure_ai_configured)
+                    self._model = genai.GenerativeModel('gemini-2.5-flash')
+                response = await loop.run_in_executor(None, self._model.generate_content, prompt)
+                reply_text = response.text
+                if self.ai_cache_enabled:
+                    now = time.monotonic()
+                    # Sweep expired replies so unique prompts don't pile up
+                    self._ai_cache = {
+                        k: v for k, v in self._ai_cache.items()
+                        if now - v[0] < _AI_CACHE_TTL
+                    }
+                    self._ai_cache[key] = (now, reply_text)
+                notice = "AI response added."
             
-            editor = self.query_one(TextArea)
+            editor = self._editor
             
             # Append the reply to the existing text
-            append_text = f"\n\n--- AI Reply ({prompt}) ---\n{response.text}\n"
+            append_text = f"\n\n--- AI Reply ({prompt}) ---\n{reply_text}\n"
             editor.insert(append_text) 
             
-            self.notify("AI response added.")
+            self.notify(notice)
             
         except Exception as e:
             self.notify(f"AI Error: {str(e)}", severity="error")
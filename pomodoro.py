@@ -1,7 +1,11 @@
+import time
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Digits
 from textual.binding import Binding
 
+# Zero-padded two-digit strings, so ticks don't format numbers
+_PAD = [f"{i:02d}" for i in range(100)]
+
 class PomodoroApp(App):
     """A Textual app for a simple Pomodoro timer."""
 
@@ -17,6 +21,8 @@ class PomodoroApp(App):
     }
     """
 
+    IDLE_DISPLAY = "00:00"
+
     BINDINGS = [
         Binding("1", "start_timer(25)", "25 Min"),
         Binding("2", "start_timer(10)", "10 Min"),
@@ -27,44 +33,55 @@ class PomodoroApp(App):
     def __init__(self):
         super().__init__()
         self.timer_obj = None
-        self.total_seconds = 0
+        # Monotonic time the countdown ends, and the seconds left last drawn
+        self._deadline = 0.0
+        self._remaining = 0
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
         # Initialize with 00:00 as requested
-        yield Digits("00:00", id="clock")
+        yield Digits(self.IDLE_DISPLAY, id="clock")
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache the clock widget so ticks don't query the DOM."""
+        self._clock = self.query_one(Digits)
+
     def action_start_timer(self, minutes: int) -> None:
         """Start a countdown for the specified number of minutes."""
         # Cancel existing timer if running
         if self.timer_obj:
             self.timer_obj.stop()
 
-        self.total_seconds = minutes * 60
+        self._remaining = minutes * 60
+        self._deadline = time.monotonic() + self._remaining
         self.update_clock_display()
         
         # set_interval returns a Timer object that we can stop later
         self.timer_obj = self.set_interval(1, self.tick)
 
     def tick(self) -> None:
-        """Decrement the timer by one second."""
-        if self.total_seconds > 0:
-            self.total_seconds -= 1
-            self.update_clock_display()
-        else:
+        """Recompute the time left from the deadline, redrawing only on change."""
+        # Derived from the deadline rather than counted down, so late or
+        # skipped ticks can't make the timer drift
+        remaining = max(0, int(round(self._deadline - time.monotonic())))
+        if remaining == 0:
             # Timer finished
             if self.timer_obj:
                 self.timer_obj.stop()
-            self.query_one(Digits).update("00:00")
+            self._remaining = 0
+            self._clock.update(self.IDLE_DISPLAY)
             self.bell() # System beep to notify user
+        elif remaining != self._remaining:
+            self._remaining = remaining
+            self.update_clock_display()
 
     def update_clock_display(self) -> None:
         """Update the Digits widget with the current time."""
-        minutes, seconds = divmod(self.total_seconds, 60)
-        time_str = f"{minutes:02d}:{seconds:02d}"
-        self.query_one(Digits).update(time_str)
+        minutes, seconds = divmod(self._remaining, 60)
+        time_str = _PAD[minutes] + ":" + _PAD[seconds]
+        self._clock.update(time_str)
 
 if __name__ == "__main__":
     app = PomodoroApp()
@@ -1,15 +1,60 @@
-import time
+import calendar
+import hashlib
 import re
+import time
 import webbrowser
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from textual.app import App, ComposeResult
 from textual.containers import VerticalScroll, Container
 from textual.widgets import Header, Footer, Static, Label
-from textual.reactive import reactive
 from textual.binding import Binding
 
+_WS_RE = re.compile(r'\s+')
+_MAX_FETCH_WORKERS = 10
+_CLEAN_CACHE_SIZE = 2048
+
+def _safe_parse(url, etag=None, modified=None):
+    """Fetch and parse a single feed, returning None on failure.
+
+    etag/modified make this a conditional GET: an unchanged feed comes
+    back with status 304 and no entries.
+    """
+    try:
+        return feedparser.parse(url, etag=etag, modified=modified)
+    except Exception:
+        return None
+
+def _extract(entry, feed_title):
+    """Flatten a feedparser entry into a story dict; 'html' is cleaned later."""
+    if 'content' in entry:
+        raw_content = entry['content'][0]['value']
+    else:
+        raw_content = entry.get('summary', '')
+
+    pub_date = entry.get('published_parsed') or entry.get('updated_parsed')
+    if pub_date:
+        # feedparser dates are UTC; mktime would treat them as local time
+        entry_ts = calendar.timegm(pub_date)
+    else:
+        entry_ts = int(time.time())
+
+    # Sort on the int timestamp; format the display strings once, up front
+    date_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry_ts))
+
+    return {
+        'key': entry.get('id') or entry.get('link') or entry.get('title'),
+        'title': entry.get('title', 'No Title'),
+        'ts': entry_ts,
+        'date_str': date_str,
+        'meta_str': f"{feed_title} | {date_str}",
+        'source': feed_title,
+        'html': raw_content,
+        'link': entry.get('link', '')
+    }
+
 class RSSReaderApp(App):
     """
     A Textual app to cycle through RSS feed stories.
@@ -64,14 +109,20 @@ class RSSReaderApp(App):
         Binding("o", "open_link", "Open in Browser"),
     ]
 
-    # State
-    stories = []
-    current_index = reactive(0)
+    # State: the story on display is always stories[0]; navigation rotates
+    stories = deque()
     auto_timer = None 
 
     def __init__(self, feed_file="feeds.txt"):
         super().__init__()
         self.feed_file = feed_file
+        # LRU of content hash -> cleaned text, reused across hourly refreshes
+        self._clean_cache: OrderedDict[bytes, str] = OrderedDict()
+        # (title, ts) of the story currently on screen
+        self._last_shown_key = None
+        # Per-feed (etag, modified) and stories, so 304 responses reuse them
+        self._feed_state: dict[str, tuple[str | None, str | None]] = {}
+        self._feed_entries: dict[str, list[dict]] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -84,6 +135,11 @@ class RSSReaderApp(App):
 
     def on_mount(self) -> None:
         """Start the app, load feeds, and set timers."""
+        # Cache widget lookups so update_display doesn't walk the DOM each tick
+        self._title_w = self.query_one("#title", Static)
+        self._meta_w = self.query_one("#meta", Label)
+        self._body_w = self.query_one("#body", Static)
+        self._scroller = self.query_one(VerticalScroll)
         self.refresh_feeds()
         self.auto_timer = self.set_interval(10.0, self.action_next_story)
         self.set_interval(3600.0, self.refresh_feeds)
@@ -99,81 +155,134 @@ class RSSReaderApp(App):
             with open(self.feed_file, 'r') as f:
                 urls = [line.strip() for line in f if line.strip()]
         except FileNotFoundError:
-            self.call_from_thread(self.query_one("#title", Static).update, "Error: feeds.txt not found")
+            self._last_shown_key = None
+            self.call_from_thread(self._title_w.update, "Error: feeds.txt not found")
             return
 
+        # Fetching is I/O-bound, so download all feeds concurrently
+        def fetch(url):
+            return _safe_parse(url, *self._feed_state.get(url, (None, None)))
+
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            results = list(zip(urls, executor.map(fetch, urls)))
+
         all_entries = []
-        for url in urls:
+        # Overlapping feeds often carry the same item; skip repeats before cleaning
+        seen = set()
+        for url, parsed in results:
+            if parsed is None:
+                continue
             try:
-                parsed = feedparser.parse(url)
-                for entry in parsed.entries:
-                    raw_content = entry.get('content', [{'value': entry.get('summary', '')}])[0]['value']
-                    clean_text = self.clean_html(raw_content)
-                    
-                    pub_date = entry.get('published_parsed') or entry.get('updated_parsed')
-                    if pub_date:
-                        dt_object = datetime.fromtimestamp(time.mktime(pub_date))
-                    else:
-                        dt_object = datetime.now()
-
-                    all_entries.append({
-                        'title': entry.get('title', 'No Title'),
-                        'date': dt_object,
-                        'source': parsed.feed.get('title', url),
-                        'body': clean_text,
-                        'link': entry.get('link', '') 
-                    })
+                if parsed.get('status') == 304 and url in self._feed_entries:
+                    feed_stories = self._feed_entries[url]
+                else:
+                    feed_title = parsed.feed.get('title', url)
+                    feed_stories = [_extract(entry, feed_title) for entry in parsed.entries]
+                    self._feed_entries[url] = feed_stories
+                    self._feed_state[url] = (parsed.get('etag'), parsed.get('modified'))
+
+                for story in feed_stories:
+                    key = story['key']
+                    if key and key in seen:
+                        continue
+
+                    if 'body' not in story:
+                        # Clean before dropping 'html' so a failure leaves the
+                        # cached story intact for the next refresh to retry,
+                        # and only skips this one entry
+                        try:
+                            story['body'] = self.cached_clean_html(story['html'])
+                        except Exception:
+                            continue
+                        del story['html']
+
+                    if key:
+                        seen.add(key)
+                    all_entries.append(story)
             except Exception:
                 continue 
 
         if all_entries:
-            self.stories = sorted(all_entries, key=lambda x: x['date'], reverse=True)
-            self.current_index = 0
-            self.call_from_thread(self.update_display)
+            self.stories = deque(sorted(all_entries, key=lambda x: x['ts'], reverse=True))
+            # The list is always swapped, but skip the repaint if the new top
+            # story is already the one on screen
+            top = self.stories[0]
+            if (top['title'], top['ts']) != self._last_shown_key:
+                self.call_from_thread(self.update_display)
         else:
-            self.call_from_thread(self.query_one("#title", Static).update, "No stories found.")
+            self._last_shown_key = None
+            self.call_from_thread(self._title_w.update, "No stories found.")
+
+    def cached_clean_html(self, html_content):
+        """clean_html, memoized by content hash so unchanged entries are free."""
+        key = hashlib.blake2b(html_content.encode('utf-8', 'ignore'), digest_size=16).digest()
+        cache = self._clean_cache
+        clean_text = cache.get(key)
+        if clean_text is not None:
+            cache.move_to_end(key)
+            return clean_text
+
+        clean_text = self.clean_html(html_content)
+        cache[key] = clean_text
+        if len(cache) > _CLEAN_CACHE_SIZE:
+            cache.popitem(last=False)
+        return clean_text
 
     def clean_html(self, html_content):
         if not html_content:
             return "No content available."
 
-        soup = BeautifulSoup(html_content, "lxml")
-        
-        first_p = soup.find('p')
-        if first_p:
-            raw_text = first_p.get_text()
-        else:
-            raw_text = soup.get_text()
+        try:
+            # Parse just the fragment; a full soup tree is overkill for one <p>
+            root = lxml_html.fragment_fromstring(html_content, create_parent='div')
+            # text_content() keeps script/style bodies, which get_text() drops
+            for el in list(root.iter('script', 'style')):
+                el.drop_tree()
+            first_p = root.find('.//p')
+            if first_p is not None:
+                raw_text = first_p.text_content()
+            else:
+                raw_text = root.text_content()
+        except Exception:
+            # lxml rejects some input outright (malformed fragments, or
+            # whole documents without a <body>); fall back to the more
+            # forgiving soup parse for anything it can't handle
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html_content, "lxml")
+
+            first_p = soup.find('p')
+            if first_p:
+                raw_text = first_p.get_text()
+            else:
+                raw_text = soup.get_text()
 
-        flat_text = re.sub(r'\s+', ' ', raw_text).strip()
+        flat_text = _WS_RE.sub(' ', raw_text).strip()
         return flat_text
 
     def update_display(self):
         if not self.stories:
             return
 
-        if self.current_index >= len(self.stories):
-            self.current_index = 0
+        story = self.stories[0]
+        self._last_shown_key = (story['title'], story['ts'])
 
-        story = self.stories[self.current_index]
-        date_str = story['date'].strftime("%Y-%m-%d %H:%M")
-        
-        self.query_one("#title", Static).update(story['title'])
-        self.query_one("#meta", Label).update(f"{story['source']} | {date_str}")
-        self.query_one("#body", Static).update(story['body'])
-        
-        self.query_one(VerticalScroll).scroll_home(animate=False)
+        # Coalesce the widget updates into a single repaint
+        with self.batch_update():
+            self._title_w.update(story['title'])
+            self._meta_w.update(story['meta_str'])
+            self._body_w.update(story['body'])
+            self._scroller.scroll_home(animate=False)
 
     def action_next_story(self):
         if self.stories:
-            self.current_index = (self.current_index + 1) % len(self.stories)
+            self.stories.rotate(-1)
             self.update_display()
             if self.auto_timer:
                 self.auto_timer.reset()
 
     def action_prev_story(self):
         if self.stories:
-            self.current_index = (self.current_index - 1) % len(self.stories)
+            self.stories.rotate(1)
             self.update_display()
             if self.auto_timer:
                 self.auto_timer.reset()
@@ -181,7 +290,7 @@ class RSSReaderApp(App):
     def action_open_link(self):
         """Opens current story link in default browser."""
         if not self.stories: return
-        link = self.stories[self.current_index].get('link')
+        link = self.stories[0].get('link')
         if link:
             webbrowser.open(link)
             self.notify(f"Opening: {link}")